@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from queue import Queue
+from queue import Empty, Queue
 from threading import Thread, current_thread, main_thread
 from typing import Any, Callable, ClassVar, Literal
 
@@ -54,13 +54,15 @@ class QueuedCallback(WeakCallback):
         # NOTE: for some strange reason, mypyc crashes if we use `self._thread` here
         # so we use `self._cbthread` instead
         self._cbthread = thread
+        # look up the target queue once, rather than on every (cross-thread) call
+        self._cbqueue: Queue[CbArgsTuple] = QueuedCallback._GLOBAL_QUEUE[thread]
         self.priority: int = wrapped.priority
 
     def cb(self, args: tuple = ()) -> None:
         if current_thread() is self._cbthread:
             self._wrapped.cb(args)
         else:
-            QueuedCallback._GLOBAL_QUEUE[self._cbthread].put((self._wrapped.cb, args))
+            self._cbqueue.put((self._wrapped.cb, args))
 
     def dereference(self) -> Callable | None:
         return self._wrapped.dereference()
@@ -86,8 +88,15 @@ def emit_queued(thread: Thread | None = None) -> None:
     _thread = current_thread() if thread is None else thread
     queue = QueuedCallback._GLOBAL_QUEUE[_thread]
 
-    while not queue.empty():
-        cb, args = queue.get()
+    # `get_nowait` until `Empty`, rather than checking `empty()` and then calling the
+    # blocking `get()`: one lock acquisition per item, and no chance of blocking if
+    # another consumer drains the queue in between.
+    get = queue.get_nowait
+    while True:
+        try:
+            cb, args = get()
+        except Empty:
+            return
         try:
             cb(args)
         except Exception as e:  # pragma: no cover
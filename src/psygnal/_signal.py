@@ -548,7 +548,10 @@ class SignalInstance:
         self._signature = signature
         self._check_nargs_on_connect = check_nargs_on_connect
         self._check_types_on_connect = check_types_on_connect
-        self._slots: list[WeakCallback] = []
+        # connected slots are stored in an immutable tuple that is *replaced* (not
+        # mutated) on connect/disconnect.  This makes iterating over the slots in the
+        # emit loop cheap, and safe against connect/disconnect calls made by callbacks
+        self._slots: tuple[WeakCallback, ...] = ()
         self._is_blocked: bool = False
         self._is_paused: bool = False
         self._lock = threading.RLock()
@@ -768,41 +771,45 @@ class SignalInstance:
         return _wrapper if slot is None else _wrapper(slot)
 
     def _append_slot(self, slot: WeakCallback) -> None:
-        """Append a slot to the list of slots.
+        """Append a slot to the tuple of slots.
 
         Implementing this as a method allows us to override/extend it in subclasses.
         """
+        slots = self._slots
         # if no previously connected slots have a priority, and this slot also
-        # has no priority, we can just (quickly) append it to the end of the list.
+        # has no priority, we can just (quickly) append it to the end of the tuple.
         if not self._priority_in_use:
             if not slot.priority:
-                self._slots.append(slot)
+                self._slots = (*slots, slot)
                 return
             # remember that we have a priority in use, so we skip this check
             self._priority_in_use = True
 
         # otherwise we need to (slowly) iterate over self._slots to
         # insert the slot in the correct position based on priority.
-        # High priority slots are placed at the front of the list
-        # low/negative priority slots are at the end of the list
-        for i, s in enumerate(self._slots):
+        # High priority slots are placed at the front of the tuple
+        # low/negative priority slots are at the end of the tuple
+        for i, s in enumerate(slots):
             if s.priority < slot.priority:
-                self._slots.insert(i, slot)
+                self._slots = (*slots[:i], slot, *slots[i:])
                 return
-        self._slots.append(slot)
+        self._slots = (*slots, slot)
 
     def _remove_slot(self, slot: Literal["all"] | int | WeakCallback) -> None:
-        """Remove a slot from the list of slots."""
+        """Remove a slot from the tuple of slots."""
         # implementing this as a method allows us to override/extend it in subclasses
         if slot == "all":
-            self._slots.clear()
-        elif isinstance(slot, int):
-            self._slots.pop(slot)
+            self._slots = ()
+            return
+        slots = list(self._slots)
+        if isinstance(slot, int):
+            slots.pop(slot)
         else:
-            self._slots.remove(cast("WeakCallback", slot))
+            slots.remove(cast("WeakCallback", slot))
+        self._slots = tuple(slots)
 
     def _try_discard(self, callback: WeakCallback, missing_ok: bool = True) -> None:
-        """Try to discard a callback from the list of slots.
+        """Try to discard a callback from the tuple of slots.
 
         Parameters
         ----------
@@ -1139,6 +1146,21 @@ class SignalInstance:
         """Return number of connected slots."""
         return len(self._slots)
 
+    def _has_receivers(self) -> bool:
+        """Return `True` if a call to `emit()` would be observed by anything.
+
+        That is: the signal is not blocked, and it either has connected slots, is
+        paused (args are queued for `resume()`), or a debug hook is installed.
+        Emitters may use this to skip work needed only to compute emitted args.
+        """
+        if self._is_blocked:
+            return False
+        return (
+            bool(self._slots)
+            or self._is_paused
+            or SignalInstance._debug_hook is not None
+        )
+
     def emit(
         self, *args: Any, check_nargs: bool = False, check_types: bool = False
     ) -> None:
@@ -1147,6 +1169,9 @@ class SignalInstance:
         !!! note
 
             `check_args` and `check_types` both add overhead when calling emit.
+            If you are emitting in a tight loop and don't need these checks (or
+            the other features listed there), see
+            [`emit_fast()`][psygnal.SignalInstance.emit_fast].
 
         Parameters
         ----------
@@ -1171,6 +1196,29 @@ class SignalInstance:
         if self._is_blocked:
             return
 
+        # a single branch for the (common) case where no checks are requested
+        if check_nargs or check_types:
+            self._check_emit_args(args, check_nargs, check_types)
+
+        if self._is_paused:
+            self._args_queue.append(args)
+            return
+
+        if SignalInstance._debug_hook is not None:
+            from ._group import EmissionInfo
+
+            SignalInstance._debug_hook(EmissionInfo(self, args))
+
+        if not self._slots:
+            # nothing to call: skip the lock and emit-queue bookkeeping
+            return
+
+        self._run_emit_loop(args)
+
+    def _check_emit_args(
+        self, args: tuple[Any, ...], check_nargs: bool, check_types: bool
+    ) -> None:
+        """Validate `args` against the signature of this signal (see `emit()`)."""
         if check_nargs:
             try:
                 self.signature.bind(*args)
@@ -1189,17 +1237,6 @@ class SignalInstance:
                 f"signature: {self.signature}"
             )
 
-        if self._is_paused:
-            self._args_queue.append(args)
-            return
-
-        if SignalInstance._debug_hook is not None:
-            from ._group import EmissionInfo
-
-            SignalInstance._debug_hook(EmissionInfo(self, args))
-
-        self._run_emit_loop(args)
-
     def emit_fast(self, *args: Any) -> None:
         """Fast emit without any checks.
 
@@ -1480,7 +1517,7 @@ class SignalInstance:
         )
         dd = {slot: getattr(self, slot) for slot in attrs}
         dd["_instance"] = self._instance()
-        dd["_slots"] = [x for x in self._slots if isinstance(x, StrongFunction)]
+        dd["_slots"] = tuple(x for x in self._slots if isinstance(x, StrongFunction))
         if len(self._slots) > len(dd["_slots"]):
             warnings.warn(
                 "Pickling a SignalInstance does not copy connected weakly referenced "
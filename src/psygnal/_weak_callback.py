@@ -468,10 +468,11 @@ class WeakBuiltin(WeakCallback):
     """Wrapper around a c-based method on a weakly-referenced object.
 
     Builtin/extension methods do have a `__self__` attribute (the object to which they
-    are bound), but don't have a __func__ attribute, so we need to store the name of the
-    method and look it up on the object when the callback is called.
-
-    When `cb` is called here, it dereferences the object, and calls:
+    are bound), but don't have a __func__ attribute.  If the method is defined on the
+    class of the object (the common case), the unbound class-level descriptor is
+    captured at creation time and `cb` calls `unbound(obj, *args)`, avoiding a
+    `getattr` and bound-method allocation on every call.  Otherwise, we store the name
+    of the method and look it up on the object when the callback is called:
     `getattr(obj.__self__, obj.__name__)(*args, **kwargs)`
     """
 
@@ -487,6 +488,7 @@ class WeakBuiltin(WeakCallback):
         super().__init__(obj, max_args, on_ref_error, priority)
         self._obj_ref = self._try_ref(obj.__self__, finalize)
         self._func_name = obj.__name__
+        self._unbound = _unbound_builtin(obj)
         self._args = args
         if args:
             self._object_repr = f"{self._object_repr}{(*args,)!r}".replace(")", " ...)")
@@ -496,18 +498,45 @@ class WeakBuiltin(WeakCallback):
         return f"{obj.__class__.__qualname__}.{self._func_name}"
 
     def cb(self, args: tuple[Any, ...] = ()) -> None:
+        if self._max_args is not None:
+            args = args[: self._max_args]
+        if self._unbound is not None:
+            obj = self._obj_ref()
+            if obj is None:
+                raise ReferenceError("weakly-referenced object no longer exists")
+            self._unbound(obj, *self._args, *args)
+            return
+
         func = getattr(self._obj_ref(), self._func_name, None)
         if func is None:
             raise ReferenceError("weakly-referenced object no longer exists")
-        if self._max_args is None:
-            func(*self._args, *args)
-        else:
-            func(*self._args, *args[: self._max_args])
+        func(*self._args, *args)
 
     def dereference(self) -> MethodWrapperType | BuiltinMethodType | None:
         return getattr(self._obj_ref(), self._func_name, None)
 
 
+def _unbound_builtin(
+    method: MethodWrapperType | BuiltinMethodType,
+) -> Callable[..., Any] | None:
+    """Return the class-level descriptor for a builtin `method`, if there is one.
+
+    Returns None if the method is not found on the class of `method.__self__` (e.g.
+    module-level builtin functions like `print`), or if the class attribute does not
+    bind to the same method (e.g. it was shadowed on the instance).
+    """
+    owner = method.__self__
+    unbound = getattr(type(owner), method.__name__, None)
+    if unbound is None or not hasattr(unbound, "__get__"):
+        return None
+    try:
+        if unbound.__get__(owner) != method:
+            return None
+    except Exception:  # pragma: no cover
+        return None
+    return cast("Callable[..., Any]", unbound)
+
+
 class WeakSetattr(WeakCallback):
     """Caller to set an attribute on a weakly-referenced object."""
 
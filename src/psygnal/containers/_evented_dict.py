@@ -22,6 +22,7 @@ _K = TypeVar("_K")
 _V = TypeVar("_V")
 TypeOrSequenceOfTypes = Union[type[_V], Sequence[type[_V]]]
 DictArg = Union[Mapping[_K, _V], Iterable[tuple[_K, _V]]]
+_MISSING = object()
 
 
 class TypedMutableMapping(MutableMapping[_K, _V]):
@@ -45,9 +46,14 @@ class TypedMutableMapping(MutableMapping[_K, _V]):
         **kwargs: _V,
     ):
         self._dict: dict[_K, _V] = {}
-        self._basetypes: tuple[type[_V], ...] = (
-            tuple(basetype) if isinstance(basetype, Sequence) else (basetype,)
-        )
+        self._basetypes: tuple[type[_V], ...]
+        # check the concrete (fast) types first, before the slower ABC check
+        if isinstance(basetype, (tuple, list)) or isinstance(basetype, Sequence):
+            self._basetypes = tuple(basetype)
+        else:
+            self._basetypes = (basetype,)
+        # for O(1) exact-type checks in `_type_check`
+        self._basetypes_set: frozenset[type[_V]] = frozenset(self._basetypes)
         self.update({} if data is None else data, **kwargs)
 
     def __setitem__(self, key: _K, value: _V) -> None:
@@ -70,7 +76,10 @@ class TypedMutableMapping(MutableMapping[_K, _V]):
 
     def _type_check(self, value: _V) -> _V:
         """Check the types of items if basetypes are set for the model."""
-        if self._basetypes and not any(isinstance(value, t) for t in self._basetypes):
+        if not self._basetypes or type(value) in self._basetypes_set:
+            # fast path: no type restriction, or value is exactly one of the basetypes
+            return value
+        if not isinstance(value, self._basetypes):
             raise TypeError(
                 f"Cannot add object with type {type(value)} to TypedDict expecting"
                 f"type {self._basetypes}"
@@ -81,6 +90,7 @@ class TypedMutableMapping(MutableMapping[_K, _V]):
         new = self.__class__()
         # separating this allows subclasses to omit these from their `__init__`
         new._basetypes = self._basetypes
+        new._basetypes_set = self._basetypes_set
         new.update(mapping)
         return new
 
@@ -174,22 +184,29 @@ class EventedDict(TypedMutableMapping[_K, _V]):
         super().__init__(data, basetype=basetype, **kwargs)
 
     def __setitem__(self, key: _K, value: _V) -> None:
-        if key not in self._dict:
-            self.events.adding.emit(key)
-            super().__setitem__(key, value)
-            self.events.added.emit(key, value)
-        else:
-            old_value = self._dict[key]
-            if value is not old_value:
-                self.events.changing.emit(key)
-                super().__setitem__(key, value)
-                self.events.changed.emit(key, old_value, value)
+        # bind to locals: a single dict lookup and a single `events` lookup.
+        # (the dict is modified directly, rather than via super().__setitem__)
+        events = self.events
+        data = self._dict
+        old_value = data.get(key, _MISSING)
+        if old_value is _MISSING:
+            value = self._type_check(value)
+            events.adding.emit(key)
+            data[key] = value
+            events.added.emit(key, value)
+        elif value is not old_value:
+            value = self._type_check(value)
+            events.changing.emit(key)
+            data[key] = value
+            events.changed.emit(key, old_value, value)
 
     def __delitem__(self, key: _K) -> None:
-        item = self._dict[key]
-        self.events.removing.emit(key)
-        super().__delitem__(key)
-        self.events.removed.emit(key, item)
+        events = self.events
+        data = self._dict
+        item = data[key]
+        events.removing.emit(key)
+        del data[key]
+        events.removed.emit(key, item)
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({super().__repr__()})"
@@ -1,6 +1,5 @@
-from functools import partial
-from typing import Any, Callable, Generic, TypeVar
-from weakref import finalize
+import operator
+from typing import Any, Callable, Generic, TypeVar, cast
 
 try:
     from wrapt import ObjectProxy
@@ -32,10 +31,16 @@ class CallableProxyEvents(ProxyEvents):
     called = Signal(tuple, dict)
 
 
-# we're using a cache instead of setting the events object directly on the proxy
-# because when wrapt is compiled as a C extensions, the ObjectProxy is not allowed
-# to add any new attributes.
-_OBJ_CACHE: dict[int, ProxyEvents] = {}
+def _setattr_may_transform(obj: Any, name: str) -> bool:
+    """Return True if `setattr(obj, name, value)` may not store `value` as is.
+
+    This is the case if the class of `obj` overrides `__setattr__`, or has a data
+    descriptor (such as a property) for `name`.
+    """
+    cls = type(obj)
+    if getattr(cls, "__setattr__", None) is not object.__setattr__:
+        return True
+    return hasattr(type(getattr(cls, name, None)), "__set__")
 
 
 class EventedObjectProxy(ObjectProxy, Generic[T]):
@@ -69,31 +74,54 @@ class EventedObjectProxy(ObjectProxy, Generic[T]):
 
     def __init__(self, target: Any):
         super().__init__(target)
+        # wrapt stores attributes prefixed with `_self_` on the proxy itself (rather
+        # than on the wrapped object). Use the ObjectProxy __setattr__ directly, so
+        # as not to emit an `attribute_set` event.
+        ObjectProxy.__setattr__(self, "_self_events", self._get_events_class())
 
     @property
     def events(self) -> ProxyEvents:  # pragma: no cover # unclear why
         """`SignalGroup` containing events for this object proxy."""
-        obj_id = id(self)
-        if obj_id not in _OBJ_CACHE:
-            _OBJ_CACHE[obj_id] = ProxyEvents()
-            finalize(self, partial(_OBJ_CACHE.pop, obj_id, None))
-        return _OBJ_CACHE[obj_id]
+        return cast("ProxyEvents", self._self_events)
+
+    def _get_events_class(self) -> ProxyEvents:
+        return ProxyEvents()
 
     def __setattr__(self, name: str, value: None) -> None:
-        before = getattr(self, name, _UNSET)
-        super().__setattr__(name, value)
-        if before is not (after := getattr(self, name, _UNSET)):
-            self.events.attribute_set(name, after)
+        signal = self._self_events.attribute_set
+        if not signal._has_receivers():
+            # nobody is listening: skip reading the attribute before and after
+            super().__setattr__(name, value)
+            return
+        wrapped = self.__wrapped__
+        if name.startswith("_self_") or _setattr_may_transform(wrapped, name):
+            # stored on the proxy itself, or the set may store something else:
+            # read the attribute back (through the proxy) after setting it.
+            before = getattr(self, name, _UNSET)
+            super().__setattr__(name, value)
+            after = getattr(self, name, _UNSET)
+        else:
+            # plain attribute: read it straight from the wrapped object, skipping
+            # the proxy's attribute forwarding, and `value` is what gets stored.
+            before = getattr(wrapped, name, _UNSET)
+            super().__setattr__(name, value)
+            after = value
+        if before is not after:
+            signal.emit(name, after)
 
     def __delattr__(self, name: str) -> None:
         super().__delattr__(name)
         self.events.attribute_deleted(name)
 
     def __setitem__(self, key: Any, value: Any) -> None:
+        signal = self._self_events.item_set
+        if not signal._has_receivers():
+            super().__setitem__(key, value)
+            return
         before = self[key]
         super().__setitem__(key, value)
         if before is not (after := self[key]):
-            self.events.item_set(key, after)
+            signal.emit(key, after)
 
     def __delitem__(self, key: Any) -> None:
         super().__delitem__(key)
@@ -105,58 +133,48 @@ class EventedObjectProxy(ObjectProxy, Generic[T]):
     def __dir__(self) -> list[str]:
         return [*dir(self.__wrapped__), "events"]
 
-    def __iadd__(self, other: Any) -> T:
-        self.events.in_place("add", other)
-        return super().__iadd__(other)  # type: ignore
-
-    def __isub__(self, other: Any) -> T:
-        self.events.in_place("sub", other)
-        return super().__isub__(other)  # type: ignore
-
-    def __imul__(self, other: Any) -> T:
-        self.events.in_place("mul", other)
-        return super().__imul__(other)  # type: ignore
-
-    def __imatmul__(self, other: Any) -> T:
-        self.events.in_place("matmul", other)
-        self.__wrapped__ @= other  # not in wrapt  # type: ignore
-        return self
-
-    def __itruediv__(self, other: Any) -> T:
-        self.events.in_place("truediv", other)
-        return super().__itruediv__(other)  # type: ignore
-
-    def __ifloordiv__(self, other: Any) -> T:
-        self.events.in_place("floordiv", other)
-        return super().__ifloordiv__(other)  # type: ignore
 
-    def __imod__(self, other: Any) -> T:
-        self.events.in_place("mod", other)
-        return super().__imod__(other)  # type: ignore
-
-    def __ipow__(self, other: Any) -> T:
-        self.events.in_place("pow", other)
-        return super().__ipow__(other)  # type: ignore
-
-    def __ilshift__(self, other: Any) -> T:
-        self.events.in_place("lshift", other)
-        return super().__ilshift__(other)  # type: ignore
-
-    def __irshift__(self, other: Any) -> T:
-        self.events.in_place("rshift", other)
-        return super().__irshift__(other)  # type: ignore
-
-    def __iand__(self, other: Any) -> T:
-        self.events.in_place("and", other)
-        return super().__iand__(other)  # type: ignore
-
-    def __ixor__(self, other: Any) -> T:
-        self.events.in_place("xor", other)
-        return super().__ixor__(other)  # type: ignore
-
-    def __ior__(self, other: Any) -> T:
-        self.events.in_place("or", other)
-        return super().__ior__(other)  # type: ignore
+# names of the in-place operators, as emitted by the `in_place` signal.
+# (these correspond to the `__i{name}__` dunder methods, and the `operator.i{name}`
+# functions)
+_IN_PLACE_OPS = (
+    "add",
+    "sub",
+    "mul",
+    "matmul",
+    "truediv",
+    "floordiv",
+    "mod",
+    "pow",
+    "lshift",
+    "rshift",
+    "and",
+    "xor",
+    "or",
+)
+
+
+def _in_place_method(op: str) -> Callable[[EventedObjectProxy, Any], Any]:
+    """Create the `__i{op}__` method for EventedObjectProxy."""
+    dunder = f"__i{op}__"
+    proxy_method = getattr(ObjectProxy, dunder, None)
+    i_op = getattr(operator, f"i{op}")
+
+    def _method(self: EventedObjectProxy, other: Any) -> Any:
+        self._self_events.in_place(op, other)
+        if proxy_method is None:  # pragma: no cover
+            # e.g. __imatmul__ is not implemented in older versions of wrapt
+            self.__wrapped__ = i_op(self.__wrapped__, other)
+            return self
+        return proxy_method(self, other)
+
+    _method.__name__ = dunder
+    _method.__qualname__ = f"EventedObjectProxy.{dunder}"
+    return _method
+
+
+for _op in _IN_PLACE_OPS:
+    setattr(EventedObjectProxy, f"__i{_op}__", _in_place_method(_op))
 
 
 class EventedCallableObjectProxy(EventedObjectProxy):
@@ -199,11 +217,10 @@ class EventedCallableObjectProxy(EventedObjectProxy):
     @property
     def events(self) -> CallableProxyEvents:  # pragma: no cover # unclear why
         """`SignalGroup` containing events for this object proxy."""
-        obj_id = id(self)
-        if obj_id not in _OBJ_CACHE:
-            _OBJ_CACHE[obj_id] = CallableProxyEvents()
-            finalize(self, partial(_OBJ_CACHE.pop, obj_id, None))
-        return _OBJ_CACHE[obj_id]  # type: ignore
+        return cast("CallableProxyEvents", self._self_events)
+
+    def _get_events_class(self) -> CallableProxyEvents:
+        return CallableProxyEvents()
 
     def __call__(self, *args: Any, **kwargs: Any) -> Any:
         """Call the wrapped object and emit a `called` signal."""
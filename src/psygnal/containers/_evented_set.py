@@ -1,20 +1,31 @@
 from __future__ import annotations
 
 import inspect
-from collections.abc import Iterable, Iterator, Mapping, MutableSet
+from collections.abc import (
+    Collection,
+    Container,
+    Iterable,
+    Iterator,
+    Mapping,
+    MutableSet,
+)
+from contextlib import AbstractContextManager, nullcontext
 from itertools import chain
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
+    ClassVar,
     Final,
     TypeVar,
     get_args,
 )
 
-from psygnal import Signal, SignalGroup
+from psygnal import Signal, SignalGroup, SignalInstance
 
 if TYPE_CHECKING:
+    from collections.abc import Set as AbstractSet
+
     from typing_extensions import Self
 
 
@@ -28,9 +39,32 @@ class BailType:
 BAIL: Final = BailType()
 
 
+_ADD_DISCARD_HOOKS = (
+    "_pre_add_hook",
+    "_post_add_hook",
+    "_pre_discard_hook",
+    "_post_discard_hook",
+)
+
+
 class _BaseMutableSet(MutableSet[_T]):
+    # slots make `self._data` (accessed by nearly every method) a fast slot load.
+    # `__weakref__` is needed so that methods can be weakly connected to signals.
+    __slots__ = ("__weakref__", "_data")
+
     _data: set[_T]  # pragma: no cover
 
+    # True if none of the add/discard hooks are overridden, in which case `add` and
+    # `discard` skip calling them.  (recomputed for each subclass)
+    _plain_hooks: ClassVar[bool] = True
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._plain_hooks = all(
+            getattr(cls, name) is getattr(_BaseMutableSet, name)
+            for name in _ADD_DISCARD_HOOKS
+        )
+
     def __init__(self, iterable: Iterable[_T] = ()):
         self._data = set()
         self._data.update(iterable)
@@ -40,6 +74,9 @@ class _BaseMutableSet(MutableSet[_T]):
 
         This has no effect if the element is already present.
         """
+        if self._plain_hooks:
+            self._do_add(item)
+            return
         _item = self._pre_add_hook(item)
         if not isinstance(_item, BailType):
             self._do_add(_item)
@@ -47,7 +84,7 @@ class _BaseMutableSet(MutableSet[_T]):
 
     def update(self, *others: Iterable[_T]) -> None:
         """Update this set with the union of this set and others."""
-        for i in chain(*others):
+        for i in _chained(others):
             self.add(i)
 
     def discard(self, item: _T) -> None:
@@ -55,6 +92,9 @@ class _BaseMutableSet(MutableSet[_T]):
 
         If the element is not a member, do nothing.
         """
+        if self._plain_hooks:
+            self._do_discard(item)
+            return
         _item = self._pre_discard_hook(item)
         if not isinstance(_item, BailType):
             self._do_discard(_item)
@@ -108,6 +148,22 @@ class _BaseMutableSet(MutableSet[_T]):
     def _do_clear(self) -> None:
         self._data.clear()
 
+    # -------- pickle support (needed for protocols 0 and 1, as there's no __dict__)
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Return the state of the set, for pickle."""
+        state = dict(getattr(self, "__dict__", {}))
+        for cls in type(self).__mro__:
+            for name in getattr(cls, "__slots__", ()):
+                if name not in ("__dict__", "__weakref__") and hasattr(self, name):
+                    state[name] = getattr(self, name)
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore the state of the set, from pickle."""
+        for name, value in state.items():
+            setattr(self, name, value)
+
     # -------- To match set API
 
     def __copy__(self) -> Self:
@@ -121,12 +177,12 @@ class _BaseMutableSet(MutableSet[_T]):
 
         (i.e. all elements that are in this set but not the others.)
         """
-        other = set(chain(*s))
+        other = _union_of(s)
         return self.__class__(i for i in self if i not in other)
 
     def difference_update(self, *s: Iterable[_T]) -> None:
         """Remove all elements of another set from this set."""
-        for i in chain(*s):
+        for i in _chained(s):
             self.discard(i)
 
     def intersection(self, *s: Iterable[_T]) -> Self:
@@ -134,15 +190,15 @@ class _BaseMutableSet(MutableSet[_T]):
 
         (i.e. all elements that are in both sets.)
         """
-        other = set.intersection(*(set(x) for x in s))
+        other = _intersection_of(s)
         return self.__class__(i for i in self if i in other)
 
     def intersection_update(self, *s: Iterable[_T]) -> None:
         """Update this set with the intersection of itself and another."""
-        other = set.intersection(*(set(x) for x in s))
-        for i in tuple(self):
-            if i not in other:
-                self.discard(i)
+        other = _intersection_of(s)
+        # collect only the items to remove (preserving order), then discard them
+        for i in [i for i in self._data if i not in other]:
+            self.discard(i)
 
     def issubset(self, __s: Iterable[Any]) -> bool:
         """Report whether another set contains this set."""
@@ -157,7 +213,11 @@ class _BaseMutableSet(MutableSet[_T]):
 
         (i.e. all elements that are in exactly one of the sets.)
         """
-        a = chain((i for i in __s if i not in self), (i for i in self if i not in __s))
+        other = _hashed(__s)
+        a = chain(
+            (i for i in other if i not in self._data),
+            (i for i in self._data if i not in other),
+        )
         return self.__class__(a)
 
     def symmetric_difference_update(self, __s: Iterable[_T]) -> None:
@@ -166,8 +226,14 @@ class _BaseMutableSet(MutableSet[_T]):
         This will remove any items in this set that are also in `other`, and
         add any items in others that are not present in this set.
         """
-        for i in __s:
-            self.discard(i) if i in self else self.add(i)
+        other = _hashed(__s)
+        data = self._data
+        to_remove = [i for i in other if i in data]
+        to_add = [i for i in other if i not in data]
+        for i in to_remove:
+            self.discard(i)
+        for i in to_add:
+            self.add(i)
 
     def union(self, *s: Iterable[_T]) -> Self:
         """Return the union of sets as a new set.
@@ -178,6 +244,31 @@ class _BaseMutableSet(MutableSet[_T]):
         new.update(*s)
         return new
 
+    # in-place operators: the MutableSet mixins add/discard one item at a time,
+    # dispatch to the (bulk) update methods instead.
+
+    def __ior__(self, it: AbstractSet[_T]) -> Self:  # type: ignore [override,misc]
+        self.update(it)
+        return self
+
+    def __iand__(self, it: AbstractSet[Any]) -> Self:
+        self.intersection_update(it)
+        return self
+
+    def __ixor__(self, it: AbstractSet[_T]) -> Self:  # type: ignore [override,misc]
+        if it is self:
+            self.clear()
+        else:
+            self.symmetric_difference_update(it)
+        return self
+
+    def __isub__(self, it: AbstractSet[_T]) -> Self:  # type: ignore [misc]
+        if it is self:
+            self.clear()
+        else:
+            self.difference_update(it)
+        return self
+
     # PYDANTIC SUPPORT
 
     @classmethod
@@ -199,12 +290,24 @@ class _BaseMutableSet(MutableSet[_T]):
 class OrderedSet(_BaseMutableSet[_T]):
     """A set that preserves insertion order, uses dict behind the scenes."""
 
+    __slots__ = ()
+
     _data: dict[_T, None]  # type: ignore  # pragma: no cover
 
     def __init__(self, iterable: Iterable[_T] = ()):
         self._data = {}
         self.update(iterable)
 
+    def update(self, *others: Iterable[_T]) -> None:
+        """Update this set with the union of this set and others."""
+        if not (self._plain_hooks and type(self)._do_add is OrderedSet._do_add):
+            # subclasses with custom hooks: add one item at a time
+            super().update(*others)
+            return
+        # a single (C-level) dict merge, rather than one `add` call per item.
+        # (`dict.fromkeys` preserves the order of first occurrence)
+        self._data.update(dict.fromkeys(_chained(others)))
+
     def _do_add(self, item: _T) -> None:
         self._data[item] = None
 
@@ -213,10 +316,15 @@ class OrderedSet(_BaseMutableSet[_T]):
 
     def __repr__(self) -> str:
         """Return repr(self)."""
-        inner = ", ".join(str(x) for x in self._data)
+        inner = ", ".join(map(repr, self._data))
         return f"{self.__class__.__name__}(({inner}))"
 
 
+# the `_do_add`/`_do_discard` implementations that EventedSet may bypass in bulk
+_BASE_ADDS = (_BaseMutableSet._do_add, OrderedSet._do_add)
+_BASE_DISCARDS = (_BaseMutableSet._do_discard, OrderedSet._do_discard)
+
+
 class SetEvents(SignalGroup):
     """Events available on [EventedSet][psygnal.containers.EventedSet].
 
@@ -264,31 +372,65 @@ class EventedSet(_BaseMutableSet[_T]):
     EventedSet({1, 2, 3, 6, 7})
     """
 
-    events: SetEvents  # pragma: no cover
+    __slots__ = ("_events",)
 
     def __init__(self, iterable: Iterable[_T] = ()):
-        self.events = self._get_events_class()
+        # the SignalGroup is only created when first accessed (see `events`)
+        self._events: SetEvents | None = None
         super().__init__(iterable)
 
+    @property
+    def events(self) -> SetEvents:
+        """SignalGroup with events related to set mutation (see SetEvents)."""
+        if self._events is None:
+            self._events = self._get_events_class()
+        return self._events
+
+    @events.setter
+    def events(self, value: SetEvents) -> None:
+        self._events = value
+
+    # Multi-item mutations below bypass the per-item `_post_*_hook` emissions:
+    # items are added/discarded silently and a single event is emitted at the end.
+    # (The event is emitted in a `finally`, so if a hook raises partway through,
+    # the items that were already added/removed are still reported.)
+
     def update(self, *others: Iterable[_T]) -> None:
         """Update this set with the union of this set and others."""
-        with self.events.items_changed.paused(_reduce_events):
-            super().update(*others)
+        added: list[_T] = []
+        try:
+            self._add_silently(_chained(others), added)
+        finally:
+            if added:
+                self._emit_change(tuple(added), ())
 
     def clear(self) -> None:
         """Remove all elements from this set."""
-        with self.events.items_changed.paused(_reduce_events):
+        if self._events is None or not self._events.items_changed._slots:
+            # nothing is listening: skip the pause/reduce machinery
+            super().clear()
+            return
+        with self._events.items_changed.paused(_reduce_events):
             super().clear()
 
     def difference_update(self, *s: Iterable[_T]) -> None:
         """Remove all elements of another set from this set."""
-        with self.events.items_changed.paused(_reduce_events):
-            super().difference_update(*s)
+        removed: list[_T] = []
+        try:
+            self._discard_silently(_chained(s), removed)
+        finally:
+            if removed:
+                self._emit_change((), tuple(removed))
 
     def intersection_update(self, *s: Iterable[_T]) -> None:
         """Update this set with the intersection of itself and another."""
-        with self.events.items_changed.paused(_reduce_events):
-            super().intersection_update(*s)
+        other = _intersection_of(s)
+        removed: list[_T] = []
+        try:
+            self._discard_silently([i for i in self._data if i not in other], removed)
+        finally:
+            if removed:
+                self._emit_change((), tuple(removed))
 
     def symmetric_difference_update(self, __s: Iterable[_T]) -> None:
         """Update this set with the symmetric difference of itself and another.
@@ -296,8 +438,93 @@ class EventedSet(_BaseMutableSet[_T]):
         This will remove any items in this set that are also in `other`, and
         add any items in others that are not present in this set.
         """
-        with self.events.items_changed.paused(_reduce_events, ((), ())):
-            super().symmetric_difference_update(__s)
+        other = _hashed(__s)
+        data = self._data
+        # split first: the two groups are disjoint, so each can be applied in bulk
+        to_remove = [i for i in other if i in data]
+        to_add = [i for i in other if i not in data]
+        self._replace_silently(to_remove, to_add)
+
+    def _replace_silently(self, to_remove: Iterable[_T], to_add: Iterable[_T]) -> None:
+        """Discard `to_remove`, then add `to_add`, and emit a single change event."""
+        added: list[_T] = []
+        removed: list[_T] = []
+        try:
+            self._discard_silently(to_remove, removed)
+            self._add_silently(to_add, added)
+        finally:
+            if added or removed:
+                self._emit_change(tuple(added), tuple(removed))
+
+    def _add_silently(self, items: Iterable[_T], added: list[_T]) -> None:
+        """Add `items` without emitting events, appending those added to `added`."""
+        if self._can_bulk_add():
+            # default hooks: filter and add in bulk, rather than item by item
+            data = self._data
+            new = [i for i in dict.fromkeys(items) if i not in data]
+            if isinstance(data, dict):
+                data.update(dict.fromkeys(new))
+            else:
+                data.update(new)
+            added.extend(new)
+            return
+
+        # a custom post-hook is still called for each item, but the per-item events
+        # are blocked: the caller emits a single event for the whole change.
+        post_hook = type(self)._post_add_hook
+        custom_post = post_hook is not EventedSet._post_add_hook
+        with self._blocked_if(custom_post):
+            for item in items:
+                _item = self._pre_add_hook(item)
+                if not isinstance(_item, BailType):
+                    self._do_add(_item)
+                    added.append(_item)
+                    if custom_post:
+                        post_hook(self, _item)
+
+    def _can_bulk_add(self) -> bool:
+        """Return True if `_add_silently` may bypass the per-item add hooks."""
+        cls = type(self)
+        return (
+            cls._pre_add_hook is EventedSet._pre_add_hook
+            and cls._post_add_hook is EventedSet._post_add_hook
+            and cls._do_add in _BASE_ADDS
+        )
+
+    def _discard_silently(self, items: Iterable[_T], removed: list[_T]) -> None:
+        """Discard `items` without emitting events, appending those to `removed`."""
+        cls = type(self)
+        post_hook = cls._post_discard_hook
+        custom_post = post_hook is not EventedSet._post_discard_hook
+        if (
+            cls._pre_discard_hook is EventedSet._pre_discard_hook
+            and not custom_post
+            and cls._do_discard in _BASE_DISCARDS
+        ):
+            data = self._data
+            gone = [i for i in dict.fromkeys(items) if i in data]
+            if isinstance(data, dict):
+                for i in gone:
+                    del data[i]
+            else:
+                data.difference_update(gone)
+            removed.extend(gone)
+            return
+
+        with self._blocked_if(custom_post):
+            for item in items:
+                _item = self._pre_discard_hook(item)
+                if not isinstance(_item, BailType):
+                    self._do_discard(_item)
+                    removed.append(_item)
+                    if custom_post:
+                        post_hook(self, _item)
+
+    def _blocked_if(self, condition: bool) -> AbstractContextManager[None]:
+        """Block `items_changed` (if `condition`), for per-item post-hook calls."""
+        if condition:
+            return self.events.items_changed.blocked()
+        return nullcontext()
 
     def _pre_add_hook(self, item: _T) -> _T | BailType:
         return BAIL if item in self else item
@@ -319,6 +546,8 @@ class EventedSet(_BaseMutableSet[_T]):
 
     def _emit_change(self, added: tuple[_T, ...], removed: tuple[_T, ...]) -> None:
         """Emit a change event."""
+        if self._events is None and SignalInstance._debug_hook is None:
+            return  # nothing can be connected yet (and no global monitor)
         self.events.items_changed.emit(added, removed)
 
     def _get_events_class(self) -> SetEvents:
@@ -339,12 +568,55 @@ class EventedOrderedSet(EventedSet, OrderedSet[_T]):
         SignalGroup that with events related to set mutation.  (see SetEvents)
     """
 
+    __slots__ = ()
+
     # reproducing init here to avoid a mkdocs warning:
     # "Parameter 'iterable' does not appear in the function signature"
     def __init__(self, iterable: Iterable[_T] = ()):
         super().__init__(iterable)
 
 
+# types that can be used directly for (fast) membership tests
+_HASHED_TYPES = (set, frozenset, dict)
+
+
+def _chained(s: tuple[Iterable[_T], ...]) -> Iterable[_T]:
+    """Return the items of all iterables in `s`, as a single iterable.
+
+    For the common case of a single argument, it is returned as is (no `chain`).
+    """
+    return s[0] if len(s) == 1 else chain(*s)
+
+
+def _union_of(s: tuple[Iterable[_T], ...]) -> Container[_T]:
+    """Return a container with the union of all iterables in `s`.
+
+    For the common case of a single set (or dict) argument, it is returned as is.
+    """
+    if len(s) == 1 and isinstance(s[0], _HASHED_TYPES):
+        return s[0]
+    return set(_chained(s))
+
+
+def _intersection_of(s: tuple[Iterable[_T], ...]) -> Container[_T]:
+    """Return a container with the intersection of all iterables in `s`.
+
+    For the common case of a single set (or dict) argument, it is returned as is.
+    """
+    if len(s) == 1 and isinstance(s[0], _HASHED_TYPES):
+        return s[0]
+    # only the first argument needs copying: `set.intersection` takes any iterable
+    return set(s[0]).intersection(*s[1:])
+
+
+def _hashed(x: Iterable[_T]) -> Collection[_T]:
+    """Return `x` as is if it supports fast membership tests, else as a dict.
+
+    (A dict, rather than a set, preserves the iteration order of `x`.)
+    """
+    return x if isinstance(x, _HASHED_TYPES) else dict.fromkeys(x)
+
+
 def _reduce_events(li: Iterable[tuple[Iterable, Iterable]]) -> tuple[tuple, tuple]:
     """Combine multiple events into a single event."""
     added_li: list = []
@@ -81,23 +81,24 @@ class SelectableEventedList(Selectable[_T], EventedList[_T]):
             Whether to return to the beginning of the list of the end has been reached,
             by default False
         """
-        if len(self) == 0:
+        n = len(self)
+        if n == 0:
             return
-        elif not self.selection:
+        selection = self.selection
+        if not selection:
             idx = -1 if step > 0 else 0
         else:
-            idx = self.index(self.selection._current) + step
-        idx_in_sequence = len(self) > idx >= 0
+            idx = self.index(selection._current_) + step
         if wraparound:
-            idx = idx % len(self)
-        elif not idx_in_sequence:
+            idx = idx % n
+        elif not n > idx >= 0:
             idx = -1 if step > 0 else 0
         next_item = self[idx]
         if expand_selection:
-            self.selection.add(next_item)
-            self.selection._current = next_item
+            selection.add(next_item)
+            selection._current = next_item
         else:
-            self.selection.active = next_item
+            selection.active = next_item
 
     def select_previous(
         self, expand_selection: bool = False, wraparound: bool = False
@@ -115,11 +116,15 @@ class SelectableEventedList(Selectable[_T], EventedList[_T]):
         Tuple[_T, ...]
             The items that were removed.
         """
-        selected_items = tuple(self.selection)
+        selection = self.selection
+        selected_items = tuple(selection)
+        # deselect everything at once (a single `items_changed` event), rather than
+        # one item at a time as each item is removed from the list.
+        selection.clear(keep_current=True)
         idx = 0
-        for item in list(self.selection):
+        for item in selected_items:
             idx = self.index(item)
-            self.remove(item)
+            del self[idx]
         new_idx = max(0, idx - 1)
         if len(self) > new_idx:
             self.selection.add(self[new_idx])
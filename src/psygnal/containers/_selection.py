@@ -1,14 +1,12 @@
 from __future__ import annotations
 
-from collections.abc import Container
-from typing import TYPE_CHECKING, Any, TypeVar
+from collections.abc import Container, Iterable
+from contextlib import suppress
+from typing import Any, TypeVar, cast
 
-from psygnal._signal import Signal
+from psygnal._signal import Signal, SignalInstance
 
-from ._evented_set import BailType, EventedOrderedSet, SetEvents
-
-if TYPE_CHECKING:
-    from collections.abc import Iterable
+from ._evented_set import _BASE_ADDS, BailType, EventedOrderedSet, SetEvents
 
 _T = TypeVar("_T")
 _S = TypeVar("_S")
@@ -73,7 +71,9 @@ class Selection(EventedOrderedSet[_T]):
         handling mouse/key events.
     """
 
-    events: SelectionEvents  # pragma: no cover
+    # `__dict__` is kept so that (unlike the other evented sets) arbitrary attributes
+    # may still be set on a Selection instance.
+    __slots__ = ("__dict__", "_active", "_current_", "_parent")
 
     def __init__(self, data: Iterable[_T] = (), parent: Container | None = None):
         self._active: _T | None = None
@@ -82,6 +82,25 @@ class Selection(EventedOrderedSet[_T]):
         super().__init__(iterable=data)
         self._update_active()
 
+    @property
+    def events(self) -> SelectionEvents:
+        """SignalGroup with events related to selection changes."""
+        return cast("SelectionEvents", super().events)
+
+    @events.setter
+    def events(self, value: SetEvents) -> None:
+        self._events = value
+
+    @property
+    def _created_events(self) -> SelectionEvents | None:
+        """The events group, or None if nothing can be listening to it yet.
+
+        (i.e. it has not been created, and no global `monitor_events` is active)
+        """
+        if self._events is None and SignalInstance._debug_hook is None:
+            return None
+        return self.events
+
     @property
     def _current(self) -> _T | None:  # pragma: no cover
         """Get current item."""
@@ -90,10 +109,11 @@ class Selection(EventedOrderedSet[_T]):
     @_current.setter
     def _current(self, value: _T | None) -> None:  # pragma: no cover
         """Set current item."""
-        if value == self._current_:
+        if value is self._current_:
             return
         self._current_ = value
-        self.events._current.emit(value)
+        if (events := self._created_events) is not None:
+            events._current.emit(value)
 
     @property
     def active(self) -> _T | None:  # pragma: no cover
@@ -105,13 +125,15 @@ class Selection(EventedOrderedSet[_T]):
         """Set the active item.
 
         This makes `value` the only selected item, and makes it current.
+        (Setting the object that is already active again, by identity, is a no-op.)
         """
-        if value == self._active:
+        if value is self._active:
             return
         self._active = value
         self.clear() if value is None else self.select_only(value)
         self._current = value
-        self.events.active.emit(value)
+        if (events := self._created_events) is not None:
+            events.active.emit(value)
 
     def clear(self, keep_current: bool = False) -> None:
         """Clear the selection.
@@ -127,12 +149,17 @@ class Selection(EventedOrderedSet[_T]):
 
     def toggle(self, obj: _T) -> None:
         """Toggle selection state of obj."""
-        self.symmetric_difference_update({obj})
+        self.discard(obj) if obj in self._data else self.add(obj)
 
     def select_only(self, obj: _T) -> None:
         """Unselect everything but `obj`. Add to selection if not currently selected."""
-        self.intersection_update({obj})
-        self.add(obj)
+        data = self._data
+        if obj in data and len(data) == 1:
+            return
+        keep = {obj}
+        # a single event for the whole change (also emitted if `obj` can't be added,
+        # e.g. because it's not in the parent, after the others have been removed)
+        self._replace_silently([i for i in data if i not in keep], (obj,))
 
     def _update_active(self) -> None:
         """On a selection event, update the active item based on selection.
@@ -140,10 +167,11 @@ class Selection(EventedOrderedSet[_T]):
         An active item is a single selected item.
         """
         if len(self) == 1:
-            self.active = next(iter(self))
+            self.active = next(iter(self._data))
         elif self._active is not None:
             self._active = None
-            self.events.active.emit(None)
+            if (events := self._created_events) is not None:
+                events.active.emit(None)
 
     def _get_events_class(self) -> SelectionEvents:
         """Override SetEvents with SelectionEvents."""
@@ -152,13 +180,43 @@ class Selection(EventedOrderedSet[_T]):
     def _emit_change(self, added: tuple[_T, ...], removed: tuple[_T, ...]) -> None:
         """Emit a change event."""
         super()._emit_change(added, removed)
+        if len(added) == len(self) > 1:
+            # multiple items were added to an empty selection at once: make the
+            # first one current, as would happen if they were added one at a time.
+            self._current = added[0]
         self._update_active()
 
+    def _can_bulk_add(self) -> bool:
+        # parent containment is checked for all items at once in `_add_silently`
+        cls = type(self)
+        return (
+            cls._pre_add_hook is Selection._pre_add_hook
+            and cls._post_add_hook is EventedOrderedSet._post_add_hook
+            and cls._do_add in _BASE_ADDS
+        )
+
+    def _add_silently(self, items: Iterable[_T], added: list[_T]) -> None:
+        if self._parent is not None and self._can_bulk_add():
+            items = tuple(items)
+            self._check_in_parent(items)
+        super()._add_silently(items, added)
+
+    def _check_in_parent(self, items: tuple[_T, ...]) -> None:
+        """Raise ValueError if any of `items` is not in the parent container."""
+        members: Container = cast("Container", self._parent)
+        if len(items) > 1 and isinstance(members, Iterable):
+            # `in` may be a linear search (e.g. for a list parent): hash it once
+            with suppress(TypeError):  # unhashable items in the parent
+                members = set(members)
+        for item in items:
+            if item not in members:
+                raise ValueError(
+                    "Cannot select an item that is not in the parent container."
+                )
+
     def _pre_add_hook(self, item: _T) -> _T | BailType:
-        if self._parent is not None and item not in self._parent:
-            raise ValueError(
-                "Cannot select an item that is not in the parent container."
-            )
+        if self._parent is not None:
+            self._check_in_parent((item,))
         return super()._pre_add_hook(item)
 
     def __hash__(self) -> int:
@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
-from contextlib import contextmanager, suppress
-from functools import partial
+from contextlib import ContextDecorator, suppress
 from pathlib import Path
+from types import (
+    BuiltinFunctionType,
+    ClassMethodDescriptorType,
+    FunctionType,
+    MethodDescriptorType,
+    WrapperDescriptorType,
+)
 from typing import TYPE_CHECKING, Any, Callable
 from warnings import warn
 
@@ -12,7 +18,7 @@ from ._group import EmissionInfo, SignalGroup
 from ._signal import SignalInstance
 
 if TYPE_CHECKING:
-    from collections.abc import Generator, Iterator
+    from collections.abc import Generator
 
 __all__ = ["iter_signal_instances", "monitor_events"]
 
@@ -21,14 +27,17 @@ def _default_event_monitor(info: EmissionInfo) -> None:
     print(f"{info.signal.name}.emit{info.args!r}")
 
 
-@contextmanager
 def monitor_events(
     obj: Any | None = None,
     logger: Callable[[EmissionInfo], Any] = _default_event_monitor,
     include_private_attrs: bool = False,
-) -> Iterator[None]:
+    *,
+    batch: bool = False,
+) -> _EventMonitor:
     """Context manager to print or collect events emitted by SignalInstances on `obj`.
 
+    (It may also be used as a function decorator.)
+
     Parameters
     ----------
     obj : object, optional
@@ -42,46 +51,126 @@ def monitor_events(
     include_private_attrs : bool
         Whether private signals (starting with an underscore) should also be logged,
         by default False
+    batch : bool
+        If `True`, emissions are collected while the context is active, and only
+        passed to `logger` (in order) when the context exits.  This keeps the cost of
+        logging (e.g. printing) out of code that emits at a high frequency.
+        By default False.
     """
-    code = getattr(logger, "__code__", None)
-    _old_api = bool(code and code.co_argcount > 1)
+    return _EventMonitor(obj, logger, include_private_attrs, batch)
+
+
+class _EventMonitor(ContextDecorator):
+    """Context manager (and decorator) returned by `monitor_events`.
+
+    (A plain class, rather than a `@contextmanager` generator, to avoid the generator
+    machinery on enter/exit.)
+    """
+
+    __slots__ = (
+        "_before",
+        "_buffer",
+        "_disconnectors",
+        "_include_private",
+        "_logger",
+        "_obj",
+        "_old_api",
+    )
+
+    def __init__(
+        self,
+        obj: Any | None,
+        logger: Callable[[EmissionInfo], Any],
+        include_private_attrs: bool,
+        batch: bool = False,
+    ) -> None:
+        self._obj = obj
+        self._logger = logger
+        self._include_private = include_private_attrs
+        self._before: Callable[[EmissionInfo], None] | None = None
+        # (signal, slot) pairs to disconnect on exit
+        self._disconnectors: list[tuple[SignalInstance, Callable]] = []
+        # emissions collected (in batch mode) until exit
+        self._buffer: list[EmissionInfo] | None = [] if batch else None
+        self._old_api = False
+
+    def _recreate_cm(self) -> _EventMonitor:
+        # when used as a decorator, each call gets a fresh monitor, so that (e.g.)
+        # recursive calls don't share (and clobber) the per-enter state.
+        batch = self._buffer is not None
+        return _EventMonitor(self._obj, self._logger, self._include_private, batch)
+
+    def __enter__(self) -> None:
+        code = getattr(self._logger, "__code__", None)
+        self._old_api = _old_api = bool(code and code.co_argcount > 1)
+        # in batch mode, collect emissions (as EmissionInfo) and log them on exit
+        buffer = self._buffer
+        logger = self._logger if buffer is None else buffer.append
+
+        if self._obj is None:
+            # install the hook globally
+            if _old_api:
+                raise ValueError(
+                    "logger function must take a single argument (an EmissionInfo "
+                    "instance)"
+                )
+            self._before = SignalInstance._debug_hook
+            SignalInstance._debug_hook = logger
+            return
 
-    if obj is None:
-        # install the hook globally
-        if _old_api:
-            raise ValueError(
-                "logger function must take a single argument (an EmissionInfo instance)"
-            )
-        before, SignalInstance._debug_hook = SignalInstance._debug_hook, logger
-    else:
         if _old_api:
             warn(
                 "logger functions must now take a single argument (an instance of "
                 "psygnal.EmissionInfo). Please update your logger function.",
                 stacklevel=2,
             )
-        disconnectors = set()
-        for siginst in iter_signal_instances(obj, include_private_attrs):
-            if _old_api:
+        reporter_cls = _NameReporter if _old_api and buffer is None else _Reporter
+        for siginst in iter_signal_instances(self._obj, self._include_private):
+            reporter = reporter_cls(siginst, logger)
+            self._disconnectors.append((siginst, siginst.connect(reporter)))
 
-                def _report(*args: Any, signal: SignalInstance = siginst) -> None:
-                    logger(signal.name, args)  # type: ignore
+    def __exit__(self, *exc_info: Any) -> None:
+        if self._obj is None:
+            SignalInstance._debug_hook = self._before
+        else:
+            for siginst, slot in self._disconnectors:
+                siginst.disconnect(slot)
+            self._disconnectors.clear()
 
+        if self._buffer:
+            logger = self._logger
+            if self._old_api:
+                for info in self._buffer:
+                    logger(info.signal.name, info.args)  # type: ignore
             else:
+                for info in self._buffer:
+                    logger(info)
+            self._buffer.clear()
 
-                def _report(*args: Any, signal: SignalInstance = siginst) -> None:
-                    logger(EmissionInfo(signal, args))
 
-            disconnectors.add(partial(siginst.disconnect, siginst.connect(_report)))
+class _Reporter:
+    """Slot connected by `monitor_events`: reports emissions of `signal` to `logger`.
 
-    try:
-        yield
-    finally:
-        if obj is None:
-            SignalInstance._debug_hook = before
-        else:
-            for disconnector in disconnectors:
-                disconnector()
+    (A small slotted callable, rather than a closure per monitored signal.)
+    """
+
+    __slots__ = ("logger", "signal")
+
+    def __init__(self, signal: SignalInstance, logger: Callable[..., Any]) -> None:
+        self.signal = signal
+        self.logger = logger
+
+    def __call__(self, *args: Any) -> None:
+        self.logger(EmissionInfo(self.signal, args))
+
+
+class _NameReporter(_Reporter):
+    """`_Reporter` for the old logger API: `logger(signal_name, args)`."""
+
+    __slots__ = ()
+
+    def __call__(self, *args: Any) -> None:
+        self.logger(self.signal.name, args)
 
 
 def iter_signal_instances(
@@ -104,20 +193,75 @@ def iter_signal_instances(
     """
     # SignalGroup
     if isinstance(obj, SignalGroup):
-        for sig in obj:
-            yield obj[sig]
+        yield from obj.signals.values()
         return
 
     # Signal attached to Class
-    for n in dir(obj):
-        if not include_private_attrs and n.startswith("_"):
-            continue
+    # (the same signal may be reachable through several attributes, e.g. a property
+    # and the private attribute backing it: yield each one only once)
+    seen: set[int] = set()
+    for n in _signal_attr_names(obj, include_private_attrs):
         with suppress(AttributeError, FutureWarning):
             attr = getattr(obj, n)
-            if isinstance(attr, SignalInstance):
-                yield attr
             if isinstance(attr, SignalGroup):
-                yield attr._psygnal_relay
+                attr = attr._psygnal_relay
+            if isinstance(attr, SignalInstance) and id(attr) not in seen:
+                seen.add(id(attr))
+                yield attr
+
+
+# class attributes of these types can never evaluate to a SignalInstance/SignalGroup
+_NON_SIGNAL_DESCRIPTORS = (
+    FunctionType,
+    BuiltinFunctionType,
+    MethodDescriptorType,
+    WrapperDescriptorType,
+    ClassMethodDescriptorType,
+    classmethod,
+    staticmethod,
+)
+
+
+def _signal_attr_names(obj: Any, include_private_attrs: bool) -> list[str]:
+    """Return (sorted) names of attributes on `obj` that may hold signals."""
+    cls = type(obj)
+    if isinstance(obj, type) or getattr(cls, "__dir__", None) is not object.__dir__:
+        # classes, modules, proxies, etc...: defer to dir()
+        names = dir(obj)
+        if not include_private_attrs:
+            names = [n for n in names if not n.startswith("_")]
+        return names
+
+    # (not cached per class: signals may be added to a class after it is created)
+    candidates = set(_class_signal_attr_names(cls, include_private_attrs))
+    for n in getattr(obj, "__dict__", ()):
+        if include_private_attrs or not n.startswith("_"):
+            candidates.add(n)
+    return sorted(candidates)
+
+
+def _class_signal_attr_names(cls: type, include_private_attrs: bool) -> tuple[str, ...]:
+    """Return names of class attributes that may evaluate to signals on an instance.
+
+    That is: everything except plain (non-descriptor) values that aren't signals
+    themselves, and functions/methods.  This only reads the class namespaces,
+    rather than calling `getattr` for every name in `dir(obj)`.
+    """
+    names: dict[str, None] = {}
+    seen: set[str] = set()
+    for klass in cls.__mro__:
+        for name, val in vars(klass).items():
+            if name in seen:  # overridden in a subclass
+                continue
+            seen.add(name)
+            if not include_private_attrs and name.startswith("_"):
+                continue
+            if isinstance(val, (SignalInstance, SignalGroup)) or (
+                hasattr(type(val), "__get__")
+                and not isinstance(val, _NON_SIGNAL_DESCRIPTORS)
+            ):
+                names[name] = None
+    return tuple(names)
 
 
 _COMPILED_EXTS = (".so", ".pyd")
@@ -71,9 +71,25 @@ def test_basetype_enforcement_on_instantiation():
 def test_basetype_enforcement_on_set_item():
     """EventedDict with basetype set should enforces types on setitem."""
     test_dict = EventedDict(basetype=int)
+    mock = Mock()
+    test_dict.events.adding.connect(mock)
     test_dict["A"] = 1
+    test_dict["B"] = True  # subclasses of basetype are allowed
     with pytest.raises(TypeError):
         test_dict["A"] = "not an int"
+    with pytest.raises(TypeError):
+        test_dict.copy()["A"] = "not an int"
+    with pytest.raises(TypeError):
+        test_dict["C"] = "not an int"
+    # no events are emitted for rejected values
+    assert mock.call_count == 2
+
+
+@pytest.mark.parametrize("basetype", [(int, str), [int, str]])
+def test_basetype_sequence(basetype):
+    test_dict = EventedDict({"A": 1, "B": "b"}, basetype=basetype)
+    with pytest.raises(TypeError):
+        test_dict["C"] = 1.0
 
 
 def test_dict_add_events(test_dict):
@@ -121,3 +137,21 @@ def test_copy_no_sync():
     d1[3] = 4
     assert len(d2) == 3
     assert d2[3] == 3
+
+
+def test_dict_none_values():
+    """Keys mapped to None should be treated as present, not as new keys."""
+    d = EventedDict({"A": None})
+    added, changed = Mock(), Mock()
+    d.events.added.connect(added)
+    d.events.changed.connect(changed)
+    d["A"] = 1
+    added.assert_not_called()
+    changed.assert_called_once_with("A", None, 1)
+
+
+def test_copy_non_string_keys():
+    d = EventedDict({1: "a", (2, 3): "b"})
+    c = d.copy()
+    assert isinstance(c, EventedDict)
+    assert c == {1: "a", (2, 3): "b"}
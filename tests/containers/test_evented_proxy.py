@@ -1,13 +1,11 @@
+import gc
+import weakref
 from unittest.mock import Mock, call
 
 import numpy as np
 
 from psygnal import EmissionInfo, SignalGroup
-from psygnal.containers import (
-    EventedCallableObjectProxy,
-    EventedObjectProxy,
-    _evented_proxy,
-)
+from psygnal.containers import EventedCallableObjectProxy, EventedObjectProxy
 from psygnal.utils import monitor_events
 
 
@@ -50,19 +48,71 @@ def test_evented_proxy():
     ]
 
 
-def test_evented_proxy_ref():
+def test_evented_proxy_setattr_descriptors():
     class T:
         def __init__(self) -> None:
-            self.x = 1
+            self._x = 1
+
+        @property
+        def x(self) -> int:
+            return self._x
+
+        @x.setter
+        def x(self, value: int) -> None:
+            self._x = abs(value)
+
+    t = EventedObjectProxy(T())
+    mock = Mock()
+    t.events.attribute_set.connect(mock)
+    t.x = -2
+    # the value read back from the property is emitted, not the value set
+    mock.assert_called_with("x", 2)
+
+
+def test_evented_proxy_setattr_class_attribute():
+    class T:
+        x = 1
 
-    assert not _evented_proxy._OBJ_CACHE
     t = EventedObjectProxy(T())
-    assert not _evented_proxy._OBJ_CACHE
-    assert isinstance(t.events, SignalGroup)  # this will actually create the group
-    assert len(_evented_proxy._OBJ_CACHE) == 1
+    mock = Mock()
+    t.events.attribute_set.connect(mock)
+    t.x = 1  # same object as the class attribute: no event
+    mock.assert_not_called()
+    t.x = 2
+    mock.assert_called_once_with("x", 2)
+
+
+def test_evented_proxy_paused_without_slots():
+    class T:
+        x = 1
+
+    t = EventedObjectProxy(T())
+    t.x = 2  # no receivers: nothing to emit
+    mock = Mock()
+    with t.events.attribute_set.paused():
+        t.x = 3
+        # connected while paused, still receives the queued emission
+        t.events.attribute_set.connect(mock)
+    mock.assert_called_once_with("x", 3)
+
+
+def test_evented_proxy_ref():
+    class T:
+        def __init__(self) -> None:
+            self.x = 1
 
-    del t  # this should clean up the object from the cache
-    assert not _evented_proxy._OBJ_CACHE
+    obj = T()
+    t = EventedObjectProxy(obj)
+    assert isinstance(t.events, SignalGroup)
+    assert t.events is t.events
+    # the events are stored on the proxy, not on the wrapped object
+    assert not hasattr(obj, "_self_events")
+    assert EventedObjectProxy(obj).events is not t.events
+
+    ref = weakref.ref(t.events)
+    del t
+    gc.collect()
+    assert ref() is None
 
 
 def test_in_place_proxies():
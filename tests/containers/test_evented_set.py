@@ -1,9 +1,11 @@
+import pickle
 from copy import copy
 from unittest.mock import Mock, call
 
 import pytest
 
 from psygnal.containers import EventedOrderedSet, EventedSet, OrderedSet
+from psygnal.containers._evented_set import BAIL
 
 
 @pytest.fixture
@@ -67,6 +69,20 @@ def test_set_pop(test_set: EventedSet):
         test_set.remove(34)
 
 
+def test_bulk_updates_emit_once(test_set: EventedSet):
+    mock = Mock()
+    test_set.events.items_changed.connect(mock)
+    test_set.update([5, 6], [6, 7])
+    mock.assert_called_once_with((5, 6, 7), ())
+    mock.reset_mock()
+    test_set.difference_update([0, 1], [1, 20])
+    mock.assert_called_once_with((), (0, 1))
+    mock.reset_mock()
+    test_set.update([5, 6])
+    test_set.difference_update([20])
+    mock.assert_not_called()
+
+
 def test_set_clear(test_set: EventedSet):
     mock = Mock()
     test_set.events.items_changed.connect(mock)
@@ -106,6 +122,58 @@ def test_set_new_objects(test_set: EventedSet, regular_set: set, meth):
     mock.assert_not_called()
 
 
+@pytest.mark.parametrize(
+    "args", [({3, 4, 5},), ([3, 4, 5],), ({3: None, 4: None},), ([2, 3], (3, 4))]
+)
+def test_set_multi_arg_parity(test_set: EventedSet, regular_set: set, args):
+    assert test_set.difference(*args) == regular_set.difference(*args)
+    assert test_set.intersection(*args) == regular_set.intersection(*args)
+    test_set.intersection_update(*args)
+    regular_set.intersection_update(*args)
+    assert test_set == regular_set
+
+
+def test_symmetric_difference_iterables(test_set: EventedSet, regular_set: set):
+    expected = regular_set.symmetric_difference([3, 4, 5, 6])
+    assert test_set.symmetric_difference([3, 4, 5, 6]) == expected
+    assert test_set.symmetric_difference(iter([3, 4, 5, 6])) == expected
+
+
+def test_symmetric_difference_update_duplicates(test_set: EventedSet, regular_set):
+    mock = Mock()
+    test_set.events.items_changed.connect(mock)
+    test_set.symmetric_difference_update([3, 5, 3, 5])
+    regular_set.symmetric_difference_update([3, 5, 3, 5])
+    assert test_set == regular_set
+    mock.assert_called_once_with((5,), (3,))
+
+
+@pytest.mark.parametrize(
+    "op, expected",
+    [
+        ("__ior__", [call((5, 6), ())]),
+        ("__iand__", [call((), (0, 1, 2))]),
+        ("__ixor__", [call((5, 6), (3, 4))]),
+        ("__isub__", [call((), (3, 4))]),
+    ],
+)
+def test_in_place_operators(test_set: EventedSet, regular_set: set, op, expected):
+    mock = Mock()
+    test_set.events.items_changed.connect(mock)
+    result = getattr(test_set, op)({3, 4, 5, 6})
+    assert result is test_set
+    assert test_set == getattr(regular_set, op)({3, 4, 5, 6})
+    assert mock.call_args_list == expected
+
+
+def test_in_place_operators_self(test_set: EventedSet):
+    test_set ^= test_set
+    assert not test_set
+    test_set.update([1, 2])
+    test_set -= test_set
+    assert not test_set
+
+
 def test_ordering():
     tup = (24, 16, 8, 4, 5, 6)
     s_tup = set(tup)
@@ -116,6 +184,7 @@ def test_ordering():
 
     assert tuple(os_tup) == tup
     assert repr(os_tup) == "OrderedSet((24, 16, 8, 4, 5, 6))"
+    assert repr(OrderedSet(["a", 1])) == "OrderedSet(('a', 1))"
     os_tup.discard(8)
     os_tup.add(8)
     assert tuple(os_tup) == (24, 16, 4, 5, 6, 8)
@@ -167,3 +236,159 @@ def test_set_emission_order():
             call((5, 6, 7, 8, 9), ()),
         ]
     )
+
+
+def test_slots(test_set: EventedSet):
+    from psygnal import SignalInstance
+
+    assert not hasattr(test_set, "__dict__")
+    # must still be weakly referenceable, so methods can be connected to signals
+    sig = SignalInstance((int,))
+    sig.connect(test_set.add, on_ref_error="raise")
+    sig.emit(10)
+    assert 10 in test_set
+
+
+def test_ordered_set_update():
+    os_ = OrderedSet([3, 1])
+    os_.update([2, 1], (5, 2, 0))
+    assert tuple(os_) == (3, 1, 2, 5, 0)
+
+    eos = EventedOrderedSet([3, 1])
+    mock = Mock()
+    eos.events.items_changed.connect(mock)
+    eos.update([2, 1], (5, 2, 0))
+    assert tuple(eos) == (3, 1, 2, 5, 0)
+    mock.assert_called_once_with((2, 5, 0), ())
+
+
+def test_bulk_updates_respect_hooks():
+    class PositiveSet(EventedSet):
+        def _pre_add_hook(self, item):
+            return BAIL if item < 0 else super()._pre_add_hook(item)
+
+    s = PositiveSet([1])
+    mock = Mock()
+    s.events.items_changed.connect(mock)
+    s.update([-1, 1, 2, 2, 3])
+    assert s == {1, 2, 3}
+    mock.assert_called_once_with((2, 3), ())
+
+
+def test_bulk_update_hook_error_emits_applied_items():
+    class FussySet(EventedSet):
+        def _pre_add_hook(self, item):
+            if item == 3:
+                raise ValueError("no threes")
+            return super()._pre_add_hook(item)
+
+    s = FussySet()
+    mock = Mock()
+    s.events.items_changed.connect(mock)
+    with pytest.raises(ValueError, match="no threes"):
+        s.update([1, 2, 3, 4])
+    assert s == {1, 2}
+    mock.assert_called_once_with((1, 2), ())
+
+
+def test_bulk_updates_call_post_hooks():
+    class LoggingSet(EventedSet):
+        def _post_add_hook(self, item):
+            added.append(item)
+            super()._post_add_hook(item)
+
+        def _post_discard_hook(self, item):
+            removed.append(item)
+            super()._post_discard_hook(item)
+
+    added: list = []
+    removed: list = []
+    s = LoggingSet()
+    mock = Mock()
+    s.events.items_changed.connect(mock)
+    s.update([1, 2])
+    assert added == [1, 2]
+    mock.assert_called_once_with((1, 2), ())
+    mock.reset_mock()
+    s.symmetric_difference_update([2, 3])
+    assert added == [1, 2, 3]
+    assert removed == [2]
+    mock.assert_called_once_with((3,), (2,))
+    s.difference_update([1])
+    s.intersection_update([])
+    assert removed == [2, 1, 3]
+
+
+def test_plain_hooks():
+    assert OrderedSet._plain_hooks
+    assert not EventedSet._plain_hooks
+    assert not EventedOrderedSet._plain_hooks
+
+    class LoggingSet(OrderedSet):
+        def _post_add_hook(self, item):
+            added.append(item)
+
+    added: list = []
+    s = LoggingSet()
+    assert not s._plain_hooks
+    s.add(1)
+    assert added == [1]
+
+
+def test_ordered_set_update_respects_hooks():
+    class PositiveSet(OrderedSet):
+        def _pre_add_hook(self, item):
+            seen.append(item)
+            return BAIL if item < 0 else item
+
+    seen: list = []
+    s = PositiveSet([1, -1])
+    s.update([2, -2])
+    assert seen == [1, -1, 2, -2]
+    assert tuple(s) == (1, 2)
+
+
+def test_events_created_lazily(test_set: EventedSet):
+    assert test_set._events is None
+    test_set.add(10)
+    test_set.clear()
+    assert test_set._events is None
+    mock = Mock()
+    test_set.events.items_changed.connect(mock)
+    assert test_set.events is test_set._events
+    test_set.add(1)
+    mock.assert_called_once_with((1,), ())
+
+
+def test_lazy_events_global_monitor(test_set: EventedSet):
+    from psygnal.utils import monitor_events
+
+    log: list = []
+    with monitor_events(logger=log.append):
+        test_set.add(10)
+    assert [(info.signal.name, info.args) for info in log] == [
+        ("items_changed", ((10,), ()))
+    ]
+
+
+@pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+@pytest.mark.parametrize("cls", [OrderedSet, EventedSet, EventedOrderedSet])
+def test_pickle(cls, protocol: int):
+    s = cls([3, 1, 2])
+    s2 = pickle.loads(pickle.dumps(s, protocol=protocol))
+    assert type(s2) is cls
+    assert tuple(s2) == tuple(s)
+    if isinstance(s2, EventedSet):
+        mock = Mock()
+        s2.events.items_changed.connect(mock)
+        s2.add(4)
+        mock.assert_called_once_with((4,), ())
+
+
+def test_monitor_events_reports_once(test_set: EventedSet):
+    from psygnal.utils import monitor_events
+
+    log: list = []
+    with monitor_events(test_set, logger=log.append, include_private_attrs=True):
+        test_set.add(10)
+    assert len(log) == 1
@@ -1,4 +1,4 @@
-from unittest.mock import Mock
+from unittest.mock import Mock, call
 
 import pytest
 
@@ -25,6 +25,15 @@ def test_select_item_not_in_list(test_list: SelectableEventedList) -> None:
     assert 6 not in test_list.selection
 
 
+def test_select_many_not_in_list(test_list: SelectableEventedList) -> None:
+    test_list.selection.clear()
+    with pytest.raises(ValueError):
+        test_list.selection.update([1, 6, 2])
+    assert not test_list.selection
+    test_list.selection.update([1, 2])
+    assert test_list.selection == {1, 2}
+
+
 def test_newly_selected_item_is_active(test_list: SelectableEventedList) -> None:
     """Items added to a selection should become active."""
     test_list.selection.clear()
@@ -42,6 +51,18 @@ def test_select_all(test_list: SelectableEventedList) -> None:
     test_list.selection.update.assert_called_once()
 
 
+def test_select_all_emits_once() -> None:
+    test_list = SelectableEventedList(range(5))
+    test_list.selection.clear()
+    mock = Mock()
+    test_list.selection.events.items_changed.connect(mock)
+    test_list.select_all()
+    mock.assert_called_once_with((0, 1, 2, 3, 4), ())
+    assert test_list.selection._parent is test_list
+    with pytest.raises(ValueError):
+        test_list.selection.add(6)
+
+
 def test_deselect_all(test_list: SelectableEventedList) -> None:
     """Deselect all should clear the selection"""
     test_list.selection.clear = Mock(wraps=test_list.selection.clear)
@@ -132,3 +153,43 @@ def test_remove_selected(test_list: SelectableEventedList) -> None:
     assert all(el not in test_list for el in initial_selection)
     assert all(el not in test_list.selection for el in initial_selection)
     assert test_list.selection == {2}
+
+
+@pytest.mark.parametrize(
+    "initial_selection, expected_selection",
+    [([3, 1], {0}), ([1, 3], {2}), ([4], {3}), ([], {0})],
+)
+def test_remove_selected_many(initial_selection, expected_selection) -> None:
+    test_list = SelectableEventedList([0, 1, 2, 3, 4])
+    test_list.selection.clear()
+    test_list.selection.update(initial_selection)
+    output = test_list.remove_selected()
+    assert output == tuple(initial_selection)
+    assert list(test_list) == [x for x in range(5) if x not in initial_selection]
+    assert test_list.selection == expected_selection
+
+
+def test_remove_selected_emits_once() -> None:
+    test_list = SelectableEventedList(range(5))
+    test_list.selection.clear()
+    test_list.selection.update([1, 3])
+    mock = Mock()
+    test_list.selection.events.items_changed.connect(mock)
+    test_list.remove_selected()
+    # exactly one event for deselecting the removed items, and one for re-selecting
+    # an item next to them.
+    assert mock.call_args_list == [call((), (1, 3)), call((2,), ())]
+
+
+def test_remove_selected_unhashable_items() -> None:
+    from psygnal.containers import EventedList
+
+    nested = EventedList([1], hashable=False)
+    test_list = SelectableEventedList([0, 2])
+    test_list._activate_on_insert = False  # (an unhashable item can't be selected)
+    test_list.insert(0, nested)
+    test_list.selection.clear()
+    test_list.selection.add(2)
+    assert test_list.remove_selected() == (2,)
+    assert list(test_list) == [nested, 0]
+    assert test_list.selection == {0}
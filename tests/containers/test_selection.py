@@ -1,5 +1,7 @@
 from unittest.mock import Mock
 
+import pytest
+
 from psygnal.containers import Selection
 
 
@@ -46,6 +48,24 @@ def test_current_setter():
     selection.events._current.emit.assert_called_once()
 
 
+def test_setters_compare_by_identity():
+    """Setting active/current does not call `__eq__` on the items."""
+
+    class Item:
+        __hash__ = object.__hash__
+
+        def __eq__(self, other):
+            raise AssertionError("__eq__ should not be called")
+
+    item = Item()
+    selection = Selection()
+    selection.active = item
+    selection.active = item
+    selection._current = item
+    assert selection.active is item
+    assert selection._current is item
+
+
 def test_active_setter():
     """Active setter should make value the only selected item, make it current and
     emit the active event."""
@@ -78,10 +98,28 @@ def test_clear():
 
 
 def test_toggle():
-    selection = Selection()
-    selection.symmetric_difference_update = Mock()
+    selection = Selection([2])
+    mock = Mock()
+    selection.events.items_changed.connect(mock)
+    selection.toggle(1)
+    assert selection == {1, 2}
+    mock.assert_called_once_with((1,), ())
+    mock.reset_mock()
     selection.toggle(1)
-    selection.symmetric_difference_update.assert_called_once()
+    assert selection == {2}
+    mock.assert_called_once_with((), (1,))
+
+
+def test_select_only_emits_once():
+    selection = Selection([1, 2, 3])
+    mock = Mock()
+    selection.events.items_changed.connect(mock)
+    selection.select_only(4)
+    assert selection == {4}
+    mock.assert_called_once_with((4,), (1, 2, 3))
+    mock.reset_mock()
+    selection.select_only(4)
+    mock.assert_not_called()
 
 
 def test_emit_change():
@@ -94,3 +132,52 @@ def test_emit_change():
 
 def test_hash():
     assert hash(Selection())
+
+
+def test_lazy_events_global_monitor():
+    from psygnal.utils import monitor_events
+
+    selection = Selection()
+    log: list = []
+    with monitor_events(logger=log.append):
+        selection.active = 1
+    names = [info.signal.name for info in log]
+    assert "items_changed" in names
+    assert "active" in names
+
+
+def test_symmetric_difference_update_not_in_parent():
+    selection = Selection([1], parent=[1, 2])
+    mock = Mock()
+    selection.events.items_changed.connect(mock)
+    with pytest.raises(ValueError):
+        selection.symmetric_difference_update([1, 99])
+    assert not selection
+    mock.assert_called_once_with((), (1,))
+
+
+def test_select_only_not_in_parent():
+    selection = Selection([1, 2], parent=[1, 2])
+    selection.active = 1
+    mock = Mock()
+    selection.events.items_changed.connect(mock)
+    with pytest.raises(ValueError):
+        selection.active = 99
+    assert not selection
+    assert selection.active is None
+    mock.assert_called_once_with((), (1,))
+
+
+def test_monitor_events_reports_once():
+    from psygnal.utils import monitor_events
+
+    selection = Selection()
+    log: list = []
+    with monitor_events(selection, logger=log.append, include_private_attrs=True):
+        selection.add(1)
+    # items_changed, _current and active: each reported once (via the group relay)
+    assert [info.args[0].signal.name for info in log] == [
+        "items_changed",
+        "_current",
+        "active",
+    ]
@@ -310,6 +310,38 @@ def test_disconnect(thread: Literal[None, "main"]) -> None:
     assert len(emitter.one_int) == 0
 
 
+def test_disconnect_during_emit() -> None:
+    """Disconnecting a slot from a callback should not skip the remaining slots."""
+    emitter = Emitter()
+    mock1, mock2 = Mock(), Mock()
+
+    def _disconnect_self(value: int) -> None:
+        emitter.one_int.disconnect(_disconnect_self)
+
+    emitter.one_int.connect(mock1)
+    emitter.one_int.connect(_disconnect_self)
+    emitter.one_int.connect(mock2)
+    emitter.one_int.emit(1)
+    mock1.assert_called_once_with(1)
+    mock2.assert_called_once_with(1)
+    assert len(emitter.one_int) == 2
+
+
+def test_connect_during_emit() -> None:
+    """A slot connected from a callback is only called from the next emission."""
+    emitter = Emitter()
+    mock = Mock()
+
+    def _connect_mock(value: int) -> None:
+        emitter.one_int.connect(mock)
+
+    emitter.one_int.connect(_connect_mock)
+    emitter.one_int.emit(1)
+    mock.assert_not_called()
+    emitter.one_int.emit(2)
+    mock.assert_called_once_with(2)
+
+
 @pytest.mark.parametrize(
     "type_",
     [
@@ -1205,3 +1237,17 @@ def test_description():
 
     assert T.sig.description == description
     assert T().sig.description == description
+
+
+def test_has_receivers():
+    sig = SignalInstance((int,))
+    assert not sig._has_receivers()
+    with sig.paused():
+        assert sig._has_receivers()
+    mock = Mock()
+    sig.connect(mock)
+    assert sig._has_receivers()
+    with sig.blocked():
+        assert not sig._has_receivers()
+    sig.disconnect(mock)
+    assert not sig._has_receivers()
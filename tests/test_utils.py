@@ -151,3 +151,104 @@ def test_debug_import(monkeypatch):
 
     with pytest.warns(UserWarning, match="PSYGNAL_UNCOMPILED no longer has any effect"):
         import psygnal  # noqa: F401
+
+
+def test_iter_signal_instances() -> None:
+    from psygnal.utils import _class_signal_attr_names, iter_signal_instances
+
+    class Group(SignalGroup):
+        changed = Signal()
+
+    class M:
+        sig = Signal()
+        _private = Signal()
+
+        def __init__(self) -> None:
+            self.group = Group()
+            self.value = 1
+
+        @property
+        def prop_group(self) -> Group:
+            return self.group
+
+        def method(self) -> None: ...
+
+    m = M()
+    found = list(iter_signal_instances(m))
+    # (the group is reachable through two attributes, but is only yielded once)
+    assert found == [m.group.all, m.sig]
+    assert "method" not in _class_signal_attr_names(M, False)
+    found = list(iter_signal_instances(m, include_private_attrs=True))
+    assert found == [m._private, m.group.all, m.sig]
+
+    # signals added to the class later are found too
+    M.late = Signal()
+    M.late.__set_name__(M, "late")
+    m2 = M()
+    assert list(iter_signal_instances(m2)) == [
+        m2.group.all,
+        m2.late,
+        m2.sig,
+    ]
+
+
+@pytest.mark.parametrize("obj", [True, None])
+def test_monitor_events_batch(obj) -> None:
+    class M:
+        sig = Signal(int)
+
+    m = M()
+    logger = Mock()
+    with monitor_events(m if obj else None, logger=logger, batch=True):
+        m.sig.emit(1)
+        m.sig.emit(2)
+        logger.assert_not_called()
+    assert logger.call_args_list == [
+        call(EmissionInfo(m.sig, (1,))),
+        call(EmissionInfo(m.sig, (2,))),
+    ]
+
+
+def test_monitor_events_decorator() -> None:
+    class Emitter:
+        sig = Signal(int)
+
+    e = Emitter()
+    log: list = []
+
+    @monitor_events(e, logger=log.append)
+    def emit(value: int) -> None:
+        e.sig.emit(value)
+
+    emit(1)
+    e.sig.emit(2)  # not monitored outside the decorated function
+    emit(3)
+    assert [info.args for info in log] == [(1,), (3,)]
+
+
+@pytest.mark.parametrize("monitored", [True, False])
+def test_monitor_events_decorator_recursive(monitored: bool) -> None:
+    from psygnal import SignalInstance
+
+    class Emitter:
+        sig = Signal(int)
+
+    e = Emitter()
+    log: list = []
+
+    @monitor_events(e if monitored else None, logger=log.append)
+    def countdown(n: int) -> None:
+        if n:
+            countdown(n - 1)
+        e.sig.emit(n)
+
+    countdown(2)
+    if monitored:
+        # like nested `with` blocks: each active level reports the emission
+        assert [info.args for info in log] == [(0,)] * 3 + [(1,)] * 2 + [(2,)]
+    else:
+        assert [info.args for info in log] == [(0,), (1,), (2,)]
+    e.sig.emit(3)  # nothing is monitoring anymore
+    assert len(log) in (3, 6)
+    assert SignalInstance._debug_hook is None
+    assert len(e.sig) == 0
@@ -237,3 +237,25 @@ def test_cb_raises() -> None:
     )
     with pytest.raises(EmitLoopError, match=error_re):
         sig.emit("a")
+
+
+def test_weak_builtin_unbound() -> None:
+    from psygnal._weak_callback import WeakBuiltin
+
+    class MyList(list): ...
+
+    obj = MyList()
+    cb = weak_callback(obj.append, finalize=Mock())
+    assert isinstance(cb, WeakBuiltin)
+    # the class-level descriptor is cached, so no getattr is needed in cb()
+    assert cb._unbound is list.append
+    cb.cb((1,))
+    assert obj == [1]
+
+    # builtins not found on the owner class fall back to getattr
+    assert weak_callback(print)._unbound is None  # type: ignore
+
+    del obj
+    gc.collect()
+    with pytest.raises(ReferenceError):
+        cb.cb((2,))